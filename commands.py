@@ -195,27 +195,26 @@ class ProgramExecutor:
 
 class Command:
     # v2 (the version must coincide with the server side)
-    def __init__(self, command, function, description="None", needs_message=False):
+    def __init__(self, command, function, description="None", needs_message=False, concurrent=False):
         """
         Constructor that initializes the Command object with a command string and a function.
         """
         self._command = command  # Store the command
         self._function = function  # Store the function reference
         self._description = description  # Store the command description
-        self._needs_message = needs_message  # Obligatority of extra data for the correct function
+        self.needs_message = needs_message  # Obligatority of extra data for the correct function
+        # Whether it can run at the same time as other commands of a batch (no UI, no dependency on the order)
+        self.concurrent = concurrent
 
     def execute(self, message=None):
         """
         Executes the function stored in the 'function' field with the given message as a parameter.
         """
-        if self._needs_message:
+        if self.needs_message:
             return self._function(message)  # Call the stored function with the message
         else:
             return self._function()
 
-    def needs_message(self):
-        return self._needs_message
-
 
 def test_command(message=None):
     #This function is for testing
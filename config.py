@@ -1,8 +1,9 @@
 import logging
+import threading
 from enum import Enum
 from logging.handlers import TimedRotatingFileHandler
 
-from init_config import Configuration
+from init_config import get_config
 
 
 # IMPROVEMENT: Added structured logging configuration
@@ -16,9 +17,18 @@ class LogLevel(Enum):
     NOTSET = 0
 
 
-configuration = Configuration() #Init for Configuration
+configuration = get_config() #Shared Configuration instance
 logger = configuration.logging #Make the logger global by creating a static variable
 
 # Other
 CONFIG_PATH = 'config/programs.json'
-VALID_TOKENS = []
\ No newline at end of file
+VALID_TOKENS = {} # token -> (username, expiration as time.monotonic())
+VALID_TOKENS_LOCK = threading.Lock() # Login and logout run on different waitress threads
+
+
+def token_lifetime(minutes) -> int:
+    """Seconds a login token is valid, 60 minutes if TOKEN_EXPIRATION_MINUTES is not configured"""
+    return (minutes or 60) * 60
+
+
+TOKEN_LIFETIME = token_lifetime(configuration["token_expiration_minutes"]) # Seconds
\ No newline at end of file
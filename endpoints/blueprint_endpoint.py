@@ -1,7 +1,7 @@
 # Blueprint for modular API routes
 from flask import jsonify
 
-from utils.APIResponse import error_handler, APIResponse
+from utils.APIResponse import APIResponse
 from utils import APIResponse
 
 
@@ -11,7 +11,7 @@ def register(app, path) -> int:
     app.add_url_rule(
         f'/api/{path}',
         endpoint=path,
-        view_func=error_handler(handler),  # Added error handling
+        view_func=handler,  # Errors are handled app-wide (register_error_handler)
         methods=methods
     )
 
@@ -1,6 +1,6 @@
 # Blueprint for modular API routes
 from flask import jsonify
-from utils.APIResponse import error_handler, APIResponse
+from utils.APIResponse import APIResponse
 from utils import APIResponse
 
 from flask import jsonify
@@ -13,7 +13,7 @@ def register(app, path) -> int:
     app.add_url_rule(
         f'/api/{path}',
         endpoint=path,
-        view_func=error_handler(handler),  # Added error handling
+        view_func=handler,  # Errors are handled app-wide (register_error_handler)
         methods=methods
     )
 
@@ -1,8 +1,8 @@
 # Blueprint for modular API routes
-from flask import jsonify, request
+from flask import Response, current_app
 
 import config
-from utils.APIResponse import error_handler, APIResponse
+from utils.APIResponse import APIResponse
 from utils import APIResponse
 
 
@@ -12,7 +12,7 @@ def register(app, path) -> int:
     app.add_url_rule(
         f'/api/{path}',
         endpoint=path,
-        view_func=error_handler(handler),  # Added error handling
+        view_func=handler,  # Errors are handled app-wide (register_error_handler)
         methods=methods
     )
 
@@ -22,16 +22,18 @@ def register(app, path) -> int:
 
 def handler() -> APIResponse:
     #Here goes the function to implement
-    if request.method == 'OPTIONS':
-        # Flask-CORS should handle this, but you can explicitly return a response if needed
-        return '', 204
-    name = config.configuration["domain_name"]
-    user = config.configuration["user_name"]
-    local_ip = config.configuration["local_ip"]
-    port = config.configuration["port"]
-    return jsonify(
-        APIResponse.SuccessResponse("APIRest is running",
-                                    {"client": f"{name}/{user}", "socket": f"{local_ip}:{port}"}).to_dict()
-    ), 200
+    # The response never changes after startup, so each app serializes it on the first request and reuses it
+    body = current_app.extensions.get('api_test_folder_body')
+    if body is None:
+        name = config.configuration["domain_name"]
+        user = config.configuration["user_name"]
+        local_ip = config.configuration["local_ip"]
+        port = config.configuration["port"]
+        body = current_app.json.dumps(
+            APIResponse.SuccessResponse("APIRest is running",
+                                        {"client": f"{name}/{user}", "socket": f"{local_ip}:{port}"}).to_dict()
+        )
+        current_app.extensions['api_test_folder_body'] = body
+    return Response(body, mimetype="application/json"), 200
     # Use APIResponse module for returning responses or errors.
     #   return jsonify(APIResponse.SuccessResponse("This is a success response").to_dict()), 200
@@ -1,10 +1,203 @@
+import hashlib
+import json
 import logging
 import os
+import platform
 import re
+import socket
+import subprocess
+import threading
+import uuid
 from logging.handlers import TimedRotatingFileHandler
 
+import psutil
+import requests
+
+# Matches Windows absolute paths like 'C:\' or 'C:/'
+_DRIVE_RE = re.compile(r"^[A-Za-z]:[\\/]")
+
+# Matches a 'key = value' line of configuration.ini. Keys can't start with '#', so comments are skipped
+_SETTING_RE = re.compile(r"^[ \t]*([^#=\s][^=\r\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*$", re.MULTILINE)
+
+_BOOLEANS = {'true': True, 'false': False}
+_NUMBER_START = frozenset("+-.0123456789")
+
+# Registry keys used to read the hardware info on Windows without spawning wmic
+_CPU_KEY = r"HARDWARE\DESCRIPTION\System\CentralProcessor\0"
+_BIOS_KEY = r"HARDWARE\DESCRIPTION\System\BIOS"
+_GPU_CLASS_KEY = r"SYSTEM\CurrentControlSet\Control\Class\{4d36e968-e325-11ce-bfc1-08002be10318}"
+
+
+def _read_hklm_value(key_path: str, value_name: str):
+    """Reads a value from HKEY_LOCAL_MACHINE. Raises OSError if the key or the value doesn't exist."""
+    import winreg
+    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
+        return winreg.QueryValueEx(key, value_name)[0]
+
+
+def _read_gpu_names() -> list:
+    """Lists the display adapters registered under the display device class key."""
+    import winreg
+    gpus = []
+    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _GPU_CLASS_KEY) as class_key:
+        index = 0
+        while True:
+            try:
+                subkey_name = winreg.EnumKey(class_key, index)
+            except OSError:
+                break  # No more adapters
+            index += 1
+            try:
+                with winreg.OpenKey(class_key, subkey_name) as subkey:
+                    gpus.append(winreg.QueryValueEx(subkey, "DriverDesc")[0])
+            except OSError:
+                continue  # Subkeys like "Properties" are not adapters
+    return gpus
+
+
+def _get_local_ip() -> str:
+    """Returns the IP of the interface used to reach the network.
+
+    Connecting a UDP socket doesn't send any packet, it only selects the route, so unlike resolving the hostname it
+    can't get stuck on a slow DNS server."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+    except OSError:
+        return "127.0.0.1"
+
+
+def _get_total_ram() -> int:
+    """Returns the total physical memory in bytes, read with kernel32's GlobalMemoryStatusEx."""
+    import ctypes
+
+    class MEMORYSTATUSEX(ctypes.Structure):
+        _fields_ = [
+            ("dwLength", ctypes.c_ulong),
+            ("dwMemoryLoad", ctypes.c_ulong),
+            ("ullTotalPhys", ctypes.c_ulonglong),
+            ("ullAvailPhys", ctypes.c_ulonglong),
+            ("ullTotalPageFile", ctypes.c_ulonglong),
+            ("ullAvailPageFile", ctypes.c_ulonglong),
+            ("ullTotalVirtual", ctypes.c_ulonglong),
+            ("ullAvailVirtual", ctypes.c_ulonglong),
+            ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+        ]
+
+    status = MEMORYSTATUSEX()
+    status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+    if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+        raise ctypes.WinError()
+    return status.ullTotalPhys
+
+
+def _get_system_drive_size() -> int:
+    """Returns the size in bytes of the drive Windows is installed on, read with kernel32's GetDiskFreeSpaceExW."""
+    import ctypes
+    system_drive = os.environ.get("SystemDrive", "C:") + "\\"
+    total_bytes = ctypes.c_ulonglong()
+    if not ctypes.windll.kernel32.GetDiskFreeSpaceExW(ctypes.c_wchar_p(system_drive), None,
+                                                      ctypes.byref(total_bytes), None):
+        raise ctypes.WinError()
+    return total_bytes.value
+
+
+# Fallback for the registry/ctypes readers. Everything is queried in a single PowerShell call (CIM) instead of
+# spawning wmic once per value. wmic is deprecated and not installed by default on Windows 11.
+_CIM_SCRIPT = (
+    "@{"
+    "cpu=(Get-CimInstance Win32_Processor | Select-Object -First 1).Name;"
+    "gpu=@((Get-CimInstance Win32_VideoController).Caption);"
+    "bios=(Get-CimInstance Win32_BIOS).SMBIOSBIOSVersion;"
+    "mb=(Get-CimInstance Win32_BaseBoard | Select-Object -First 1 Manufacturer,Product);"
+    "dns=@((Get-DnsClientServerAddress).ServerAddresses)"
+    "} | ConvertTo-Json -Compress"
+)
+
+
+def _query_cim_info() -> dict:
+    """Queries CPU, GPU, BIOS, motherboard and DNS info with one PowerShell process and returns the parsed JSON."""
+    output = subprocess.run(["powershell", "-NoProfile", "-NonInteractive", "-Command", _CIM_SCRIPT],
+                            capture_output=True, check=True, timeout=5).stdout
+    return json.loads(output)
+
+
+def _get_dns_servers() -> list:
+    """Reads the DNS servers of every network adapter with iphlpapi's GetAdaptersAddresses.
+
+    Unlike parsing 'ipconfig /all' it doesn't spawn a process and doesn't depend on the system language."""
+    import ctypes
+    from ctypes import wintypes
+
+    class SOCKADDR(ctypes.Structure):
+        _fields_ = [("sa_family", wintypes.USHORT), ("sa_data", ctypes.c_char * 14)]
+
+    class SOCKET_ADDRESS(ctypes.Structure):
+        _fields_ = [("lpSockaddr", ctypes.POINTER(SOCKADDR)), ("iSockaddrLength", wintypes.INT)]
+
+    class IP_ADAPTER_DNS_SERVER_ADDRESS(ctypes.Structure):
+        pass
+
+    IP_ADAPTER_DNS_SERVER_ADDRESS._fields_ = [
+        ("Alignment", ctypes.c_ulonglong),
+        ("Next", ctypes.POINTER(IP_ADAPTER_DNS_SERVER_ADDRESS)),
+        ("Address", SOCKET_ADDRESS),
+    ]
+
+    # Only the fields up to FirstDnsServerAddress are needed, the rest of the struct is never read
+    class IP_ADAPTER_ADDRESSES(ctypes.Structure):
+        pass
+
+    IP_ADAPTER_ADDRESSES._fields_ = [
+        ("Alignment", ctypes.c_ulonglong),
+        ("Next", ctypes.POINTER(IP_ADAPTER_ADDRESSES)),
+        ("AdapterName", ctypes.c_char_p),
+        ("FirstUnicastAddress", ctypes.c_void_p),
+        ("FirstAnycastAddress", ctypes.c_void_p),
+        ("FirstMulticastAddress", ctypes.c_void_p),
+        ("FirstDnsServerAddress", ctypes.POINTER(IP_ADAPTER_DNS_SERVER_ADDRESS)),
+    ]
+
+    AF_UNSPEC = 0
+    GAA_FLAGS = 0x0001 | 0x0002 | 0x0004  # Skip unicast, anycast and multicast addresses
+    ERROR_BUFFER_OVERFLOW = 111
+
+    get_adapters_addresses = ctypes.windll.iphlpapi.GetAdaptersAddresses
+    size = wintypes.ULONG(15 * 1024)  # Recommended initial buffer size
+    while True:
+        buffer = ctypes.create_string_buffer(size.value)
+        error = get_adapters_addresses(AF_UNSPEC, GAA_FLAGS, None, buffer, ctypes.byref(size))
+        if error != ERROR_BUFFER_OVERFLOW:
+            break  # On overflow 'size' has been updated with the needed size, so try again
+    if error != 0:
+        raise OSError(error, "GetAdaptersAddresses failed")
+
+    dns_servers = []
+    adapter = ctypes.cast(buffer, ctypes.POINTER(IP_ADAPTER_ADDRESSES))
+    while adapter:
+        dns = adapter.contents.FirstDnsServerAddress
+        while dns:
+            sockaddr = dns.contents.Address.lpSockaddr
+            raw = ctypes.string_at(sockaddr, dns.contents.Address.iSockaddrLength)
+            family = sockaddr.contents.sa_family
+            if family == socket.AF_INET:
+                address = socket.inet_ntop(socket.AF_INET, raw[4:8])
+            elif family == socket.AF_INET6:
+                address = socket.inet_ntop(socket.AF_INET6, raw[8:24])
+            else:
+                address = None
+            if address and address not in dns_servers:
+                dns_servers.append(address)
+            dns = dns.contents.Next
+        adapter = adapter.contents.Next
+
+    return dns_servers
+
 
 class Configuration:
+    _logging_done = False  # Shared by every instance, logging is configured once per process
+
     def __init__(self, config_path='configuration.ini'):
         self._system_info = {}
         self.logging = None
@@ -21,33 +214,45 @@ class Configuration:
         self.check_files()
 
     def logging_configuration(self) -> logging:
+        # The handlers are attached to the root logger, so they are only created once per process
+        if Configuration._logging_done:
+            self.logging = logging.getLogger(__name__)
+            return self.logging
+
         log_file = "logs/system.log"
+        # Creates a new log file every day and keeps 7 days
+        file_handler = TimedRotatingFileHandler(log_file, when="midnight", interval=1, backupCount=7, encoding="utf-8")
         logging.basicConfig(
             level=logging.DEBUG,
             format="%(asctime)s - %(levelname)s - %(message)s",
             handlers=[
                 logging.StreamHandler(),
-                # Creates a new log file every day and keeps 7 days
-                TimedRotatingFileHandler(log_file, when="midnight", interval=1, backupCount=7, encoding="utf-8")
+                file_handler
             ]
         )
+        Configuration._logging_done = True
         self.logging: logging = logging.getLogger(__name__)
 
         return self.logging
 
     def load_specifications(self):
-        import os
-        import socket
-        import json
-        import platform
-        import uuid
-        import psutil
-        import requests
-        import subprocess
-
         system_info_path = "logs/system_info.json"
         self._system_info = {}
 
+        def get_fingerprint() -> str:
+            """Identifies the computer the cached info belongs to. If it changes, all the info is gathered again."""
+            return hashlib.sha1(f"{socket.gethostname()}|{uuid.getnode()}|{platform.version()}".encode()).hexdigest()
+
+        def get_volatile_info() -> dict:
+            """Gather the values that can change between starts of the same computer"""
+            # Public IP
+            try:
+                public_ip = requests.get("https://api64.ipify.org", timeout=(1, 2)).text
+            except requests.RequestException:
+                public_ip = "Unknown"
+
+            return {"local_ip": _get_local_ip(), "public_ip": public_ip}
+
         # In the specifications file there is a list of static values of the client (name, local ip, etc)
         def get_system_info() -> dict:
             """Gather all the info from the guest computer and store it on system_info.json"""
@@ -55,7 +260,6 @@ class Configuration:
                 # Basic System Info
                 system_info = {
                     "computer_name": socket.gethostname(),
-                    "local_ip": socket.gethostbyname(socket.gethostname()),
                     "mac_address": ':'.join(f"{(uuid.getnode() >> i) & 0xff:02x}" for i in range(0, 48, 8)),
                     "os": platform.system(),
                     "os_version": platform.version(),
@@ -65,25 +269,50 @@ class Configuration:
                     "domain_name": os.getenv("USERDOMAIN", "Unknown")
                 }
 
+                cim_info = None
+
+                def cim_value(key):
+                    """Gets a value from the CIM fallback. The PowerShell query only runs the first time it's needed."""
+                    nonlocal cim_info
+                    if cim_info is None:
+                        try:
+                            cim_info = _query_cim_info() if platform.system() == "Windows" else {}
+                        except Exception:
+                            cim_info = {}
+                    return cim_info.get(key)
+
                 # Hardware Info
-                output = subprocess.check_output(
-                    "wmic cpu get name", shell=True
-                ).decode().strip().split("\n")[1:]  # Ignore the header row
-                cpu_name = output[0].strip() if output else "Unknown"
+                try:
+                    cpu_name = _read_hklm_value(_CPU_KEY, "ProcessorNameString")
+                except (ImportError, OSError):
+                    # Registry not available (or not Windows), fall back to CIM
+                    cpu_name = cim_value("cpu") or "Unknown"
+                cpu_name = cpu_name.strip()
+
+                # On Windows '/' isn't the system drive, so the sizes are read directly from kernel32
+                ram_size = disk_size = None
+                if platform.system() == "Windows":
+                    try:
+                        ram_size, disk_size = _get_total_ram(), _get_system_drive_size()
+                    except OSError:
+                        pass  # Use psutil instead
+                if ram_size is None:
+                    ram_size, disk_size = psutil.virtual_memory().total, psutil.disk_usage('/').total
 
                 system_info.update({
                     "cpu": cpu_name,
                     "cpu_cores": os.cpu_count(),
-                    "ram_size_mb": psutil.virtual_memory().total // (1024 ** 2),
-                    "disk_size_gb": psutil.disk_usage('/').total // (1024 ** 3)
+                    "ram_size_mb": ram_size // (1024 ** 2),
+                    "disk_size_gb": disk_size // (1024 ** 3)
                 })
 
                 # GPU Info (Windows)
                 if platform.system() == "Windows":
                     try:
-                        output = subprocess.check_output(
-                            "wmic path win32_videocontroller get caption", shell=True
-                        ).decode().strip().split("\n")[1:]  # Ignore the header row
+                        try:
+                            output = _read_gpu_names()
+                        except OSError:
+                            output = cim_value("gpu") or []
 
                         # Clean up output and filter empty/virtual entries
                         gpus = [gpu.strip() for gpu in output if gpu.strip() and "virtual" not in gpu.lower()]
@@ -92,18 +321,19 @@ class Configuration:
                     except Exception:
                         system_info["gpu"] = "Unknown"
 
-                # Public IP
-                try:
-                    system_info["public_ip"] = requests.get("https://api64.ipify.org", timeout=3).text
-                except requests.RequestException:
-                    system_info["public_ip"] = "Unknown"
+                # Local & Public IP. The public IP needs a request to an external service, so it's refreshed in the
+                # background and meanwhile the last known value is used
+                system_info["local_ip"] = _get_local_ip()
+                system_info["public_ip"] = cached_info.get("public_ip", "Unknown")
 
                 # Network Info (Windows)
                 if platform.system() == "Windows":
                     try:
-                        net_info = subprocess.check_output("ipconfig /all", shell=True).decode()
-                        dns_servers = [line.split(":")[-1].strip() for line in net_info.split("\n") if
-                                       "DNS Servers" in line]
+                        try:
+                            dns_servers = _get_dns_servers()
+                        except Exception:
+                            # ctypes call failed, fall back to CIM
+                            dns_servers = cim_value("dns") or []
                         system_info["dns_servers"] = dns_servers
                     except Exception:
                         system_info["dns_servers"] = []
@@ -111,17 +341,27 @@ class Configuration:
                 # BIOS & Motherboard Info (Windows)
                 if platform.system() == "Windows":
                     try:
-                        bios_version = \
-                        subprocess.check_output("wmic bios get smbiosbiosversion", shell=True).decode().strip().split(
-                            "\n")[1].strip()
-                        system_info["bios_version"] = bios_version
+                        try:
+                            bios_version = _read_hklm_value(_BIOS_KEY, "BIOSVersion")
+                            # REG_MULTI_SZ values are returned as a list
+                            if isinstance(bios_version, list):
+                                bios_version = " ".join(bios_version)
+                        except OSError:
+                            bios_version = cim_value("bios") or "Unknown"
+                        system_info["bios_version"] = bios_version.strip()
                     except Exception:
                         system_info["bios_version"] = "Unknown"
 
                     try:
-                        motherboard = subprocess.check_output("wmic baseboard get product,manufacturer",
-                                                              shell=True).decode().strip().split("\n")[1].strip()
-                        system_info["motherboard"] = motherboard
+                        try:
+                            motherboard = (f"{_read_hklm_value(_BIOS_KEY, 'BaseBoardManufacturer')} "
+                                           f"{_read_hklm_value(_BIOS_KEY, 'BaseBoardProduct')}")
+                        except OSError:
+                            baseboard = cim_value("mb") or {}
+                            motherboard = f"{baseboard.get('Manufacturer', '')} {baseboard.get('Product', '')}"
+                            if not motherboard.strip():
+                                motherboard = "Unknown"
+                        system_info["motherboard"] = motherboard.strip()
                     except Exception:
                         system_info["motherboard"] = "Unknown"
 
@@ -129,18 +369,46 @@ class Configuration:
             except Exception as e:
                 return {"error": f"Failed to gather system info: {str(e)}"}
 
+        def write_system_info(info: dict, filename=system_info_path):
+            # Write to a temporary file and replace, so the file is never left half written
+            temp_filename = f"{filename}.tmp"
+            with open(temp_filename, "w", encoding="utf-8") as file:
+                json.dump(info, file, indent=4)
+            os.replace(temp_filename, filename)
+
         def save_system_info(filename=system_info_path) -> dict:
             info = get_system_info()
-            with open(filename, "w", encoding="utf-8") as file:
-                json.dump(info, file, indent=4)
-                file.close()
+            info["fingerprint"] = get_fingerprint()
+            write_system_info(info, filename)
             return info
 
-        # Run the function to save the info
-        if not os.path.exists(system_info_path):
+        def refresh_volatile_info(filename=system_info_path):
+            """Updates the cached info with the values that can change between starts"""
+            try:
+                self._system_info.update(get_volatile_info())
+                write_system_info(self._system_info, filename)
+            except Exception as e:
+                self.logging.log(logging.WARNING, f"Failed to refresh system info: {e}")
+
+        # Most of the info is static, so if system_info.json belongs to this computer it's used as it is and only
+        # the volatile values are refreshed in the background
+        cached_info = {}
+        if os.path.exists(system_info_path):
+            try:
+                with open(system_info_path, "r", encoding="utf-8") as file:
+                    cached_info = json.load(file)
+                if "error" not in cached_info and cached_info.get("fingerprint") == get_fingerprint():
+                    self._system_info = cached_info
+                    threading.Thread(target=refresh_volatile_info, daemon=True).start()
+                    return self._system_info
+            except (OSError, ValueError) as e:
+                self.logging.log(logging.DEBUG, f"Invalid system_info.json file, creating a new one. - {e}")
+        else:
             self.logging.log(logging.DEBUG, f"No system_info.json file. Creating one.")
 
         self._system_info = save_system_info()
+        if "error" not in self._system_info:
+            threading.Thread(target=refresh_volatile_info, daemon=True).start()
         return self._system_info
 
     def load_config(self):
@@ -150,22 +418,26 @@ class Configuration:
 
         self._settings = {}
         with open(self.config_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#"):  # Ignore empty lines and comments
-                    key, value = map(str.strip, line.split("=", 1))
-                    # The key is no case-sensitive
-                    self._settings[str.lower(key)] = self.parse_value(value)
-            f.close()
+            text = f.read()
+        # Empty lines, comments and lines without '=' don't match
+        for match in _SETTING_RE.finditer(text):
+            # The key is no case-sensitive
+            self._settings[match.group(1).lower()] = self.parse_value(match.group(2))
 
     def parse_value(self, value):
         """Converts string values to appropriate data types."""
-        if value.lower() in ['true', 'false']:  # Boolean conversion
-            return value.lower() == 'true'
-        elif value.isdigit():  # Integer conversion
-            return int(value)
-        elif value.replace('.', '', 1).isdigit():  # Float conversion
-            return float(value)
+        boolean = _BOOLEANS.get(value.lower())
+        if boolean is not None:  # Boolean conversion
+            return boolean
+        # Only values that start like a number are tried, so words like 'nan' or 'inf' stay as strings
+        if value and value[0] in _NUMBER_START:
+            try:
+                return int(value)  # Integer conversion
+            except ValueError:
+                try:
+                    return float(value)  # Float conversion
+                except ValueError:
+                    pass
         return value  # Default to string
 
     def get_specification_info(self, key_path):
@@ -186,8 +458,9 @@ class Configuration:
     def check_files(self):
         """Check for important directories and files inside the proyect."""
         #Checking downloads
-        is_absolute_path = bool(re.match(r"^[A-Za-z]:[\\/]", self._settings.get("path_downloads")))
-        downloads_folder = os.path.join(os.getcwd(), "downloads") if is_absolute_path else self._settings.get("path_downloads")
+        path_downloads = self._settings.get("path_downloads")
+        is_absolute_path = bool(_DRIVE_RE.match(path_downloads))
+        downloads_folder = os.path.join(os.getcwd(), "downloads") if is_absolute_path else path_downloads
         try:
             os.makedirs(downloads_folder, exist_ok=True)
         except Exception as e:
@@ -202,3 +475,17 @@ class Configuration:
             return self._system_info.get(key, default if default else "Unknown")
         else:
             self.logging.log(logging.ERROR, f"{key} is not in suported dicts on Configuration.")
+
+
+_configuration = None
+_configuration_lock = threading.Lock()
+
+
+def get_config() -> Configuration:
+    """Returns the Configuration shared by the whole process. It's created on the first call."""
+    global _configuration
+    if _configuration is None:
+        with _configuration_lock:
+            if _configuration is None:  # Another thread may have created it while waiting for the lock
+                _configuration = Configuration()
+    return _configuration
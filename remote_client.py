@@ -1,27 +1,82 @@
+import importlib.util
 import json
 import os
+import re
+import secrets
+import time
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 
 import psutil
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from flask_cors import CORS
 from waitress import serve
 import multiprocessing
-import logging
 from functools import wraps
 
 import config
 from commands import Command, test_command, show_popup, CommandsFunctions
-from config import logger, CONFIG_PATH, VALID_TOKENS
+from config import logger, CONFIG_PATH, VALID_TOKENS, VALID_TOKENS_LOCK, TOKEN_LIFETIME
 from utils import APIResponse
-from utils.APIResponse import ErrorResponse, error_handler
+from utils.APIResponse import ErrorResponse, register_error_handler
 from utils.endpoints_loader import  load_endpoints
+from utils.json_provider import set_json_provider
+
+# Bodies of the error responses whose message never changes. They're built once, jsonify doesn't modify them
+_ERR_NO_COMMAND = APIResponse.APIResponse('error', "Command not provided").to_dict()
+_ERR_BODY_TOO_LARGE = APIResponse.APIResponse('error', "Request body too large").to_dict()
+_ERR_EMPTY_BATCH = APIResponse.APIResponse('error', "Commands list is empty").to_dict()
+_ERR_MISSING_PID = APIResponse.APIResponse('error', 'Missing process_id').to_dict()
+_ERR_NO_PROCESS = APIResponse.APIResponse('error', 'Process not found').to_dict()
+_ERR_CONFIG_MISSING = APIResponse.APIResponse('error', 'Configuration file not found').to_dict()
+_ERR_INVALID_CREDENTIALS = APIResponse.APIResponse('error', 'Invalid credentials').to_dict()
+_ERR_INVALID_TOKEN = APIResponse.APIResponse('error', 'Invalid token').to_dict()
+
+MAX_COMMAND_BODY = 64 * 1024  # Bytes accepted by command_endpoint
+PROCESS_LIST_TTL = 1  # Seconds a process list is reused by list_processes
+BATCH_MAX_WORKERS = 8  # Maximum number of commands of a batch executed at the same time
+SYSTEM_LOGS_TTL = 5  # Seconds the system logs are reused by get_system_logs
+HEALTH_CHECK_TIMEOUT = 5  # Seconds a health probe may take before the peer is reported as down
+PARALLEL_REQUEST_WORKERS = 16  # Maximum number of requests send_requests_parallel keeps in flight
+CORS_ORIGIN_RE = re.compile(r'^http://(localhost|127\.0\.0\.1)(:\d+)?$')  # Local development origins, any port
+EVENT_XML_NAMESPACE = {'e': 'http://schemas.microsoft.com/win/2004/08/events/event'}
+
+
+def _effective_cpus() -> int:
+    """ CPUs this process may run on. Under a CPU affinity mask or a container limit it can be less than cpu_count() """
+    if hasattr(os, 'sched_getaffinity'):  # Not available on Windows
+        return len(os.sched_getaffinity(0))
+    return multiprocessing.cpu_count()
+
+
+# Waitress worker threads. Past 8, extra threads only add GIL contention for the pure-Python parts of the handlers
+SERVER_THREADS = int(os.environ.get('WAITRESS_THREADS', min(_effective_cpus() * 2, 8)))
+
+
+class _Flask(Flask):
+    """Flask app whose automatic OPTIONS answer (CORS preflight) is an empty 204 instead of a 200"""
+
+    def make_default_options_response(self):
+        response = super().make_default_options_response()
+        response.status_code = 204
+        return response
 
 
 class RemoteClient:
+    # Built-in routes. New routes like '/api/endpoint' are defined as:
+    #    ('endpoint', 'function_endpoint', ("POST", "GET"))
+    _ROUTES = (
+        ('command', 'command_endpoint', ("POST",)),
+        ('health', 'health_check_endpoint', ("GET",)),
+    )
+    # win32evtlog (pywin32) is only imported when the system logs are read, but whether it exists is checked once
+    _WIN32EVTLOG_AVAILABLE = importlib.util.find_spec('win32evtlog') is not None
+
     def __init__(self, name: str, port: int, target_url: str, debug: bool = False):
         """
         Initialize the RemoteClient with a name, port for its server, and the target URL.
@@ -36,45 +91,60 @@ class RemoteClient:
         self.port = port
         self.target_url = target_url
         self.debug = debug
-        self.app = Flask(__name__)
+        # The routes don't list OPTIONS, so Flask answers preflights itself without running the views
+        self.app = _Flask(__name__)
+        set_json_provider(self.app)
+        # Read by the dynamic endpoints, which have no access to the RemoteClient instance
+        self.app.config['CLIENT_NAME'] = name
+        self.app.config['CLIENT_PORT'] = port
         # IMPROVEMENT: Using session for better performance
         self.session = requests.Session()
+        self._mount_adapter(SERVER_THREADS)
+        self.session.headers.update({'User-Agent': f'RemoteClient/{self.name}', 'Connection': 'keep-alive'})
         self.commands: Dict[str, Command] = {}
 
         # IMPROVEMENT: More secure CORS configuration
         CORS(self.app, resources={
             r"/api/*": {
                 # SECURITY: Restrict to local development only
-                "origins": ["http://localhost:*", "http://127.0.0.1:*"],
+                "origins": [CORS_ORIGIN_RE],
                 "methods": ["OPTIONS", "POST", "GET"],
-                "allow_headers": ["Content-Type"]
+                "allow_headers": ["Content-Type"],
+                "max_age": 86400  # Browsers reuse the preflight answer for a day
             }
         })
 
         self._register_routes()
         self._initialize_commands()  # Add the existing commands to the Commands class dictionary
 
-        # Health check system
-        self.last_health_check = None
+        # (timestamp, serialized response) of the last process table walk
+        self._processes_cache = (0.0, None)
+        # (st_mtime_ns, programs) of the last read of CONFIG_PATH
+        self._programs_cache = (None, None)
+        # (timestamp, logs) of the last read of the System event log
+        self._system_logs_cache = (0.0, None)
+        # Set by stop() to end the background threads
+        self._shutdown = threading.Event()
+
+        # Latest CPU, RAM and disk sample. A background thread refreshes it, so get_system_info never waits on psutil
+        self._start_system_info_sampler()
+
+        # Health check system. The dict is updated in place, so readers never see it replaced half way
+        self.last_health_check = {'timestamp': None, 'ok': False, 'peer': None}
         self._start_health_check()
 
     def _register_routes(self):
         """
         IMPROVEMENT: Centralized route registration with error handling
         """
+        # A single app-wide handler answers the unhandled exceptions of every route, built-in or dynamic
+        register_error_handler(self.app)
 
-        # New routes like '/api/endpoint' are defined as:
-        #    'endpoint': (self.function_endpoint, ["POST", "GET"])
-        routes = {
-            'command': (self.command_endpoint, ["POST"]),
-            'health': (self.health_check_endpoint, ["GET"]),
-        }
-
-        for route_name, (handler, methods) in routes.items():
+        for route_name, handler_name, methods in self._ROUTES:
             self.app.add_url_rule(
                 f'/api/{route_name}',
                 endpoint=route_name,
-                view_func=error_handler(handler),  # Added error handling
+                view_func=getattr(self, handler_name),
                 methods=methods
             )
 
@@ -91,7 +161,7 @@ class RemoteClient:
             _commands['popup'] = Command(command='popup', function=CommandsFunctions.PopUp,
                                          description="This is an example API function.", needs_message=True)
             _commands['test_command'] = Command(command='test_command', function=CommandsFunctions.TestFunction,
-                                                description="Command for testing")
+                                                description="Command for testing", concurrent=True)
             _commands['execute_program'] = Command(command='execute_program', function=CommandsFunctions.ExecuteProgram, needs_message=True,
                                                    description="Run a .exe or .bat")
             logger.info("Commands initialized successfully")
@@ -100,24 +170,24 @@ class RemoteClient:
             raise
         self.commands = _commands
 
-    # IMPROVEMENT: Made request sending asynchronous
-    async def send_request(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def send_request(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
+        Sends data to the target client and returns its JSON response.
+
         IMPROVEMENTS:
-        - Added async support
         - Added timeout
         - Better error handling
         - Using session for connection pooling
         """
         try:
-            async with self.session.post(
-                    f'{self.target_url}/receive',
-                    json=data,
-                    timeout=10  # SECURITY: Added timeout to prevent hanging
-            ) as response:
-                response_data = await response.json()
-                logger.info(f"{self.name} sent request. Response: {response_data}")
-                return response_data
+            response = self.session.post(
+                f'{self.target_url}/receive',
+                json=data,
+                timeout=10  # SECURITY: Added timeout to prevent hanging
+            )
+            response_data = response.json()
+            logger.info(f"{self.name} sent request. Response: {response_data}")
+            return response_data
         except requests.exceptions.Timeout:
             logger.error(f"{self.name}: Request timed out")
             raise
@@ -125,12 +195,39 @@ class RemoteClient:
             logger.error(f"{self.name} failed to send request: {e}")
             raise
 
-    def start_server(self):
+    def send_requests_parallel(self, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Sends several payloads to the target client at the same time and returns their JSON responses in order.
+        The requests share the session's connection pool, so the connections are reused between calls.
+        """
+        if not payloads:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(payloads), PARALLEL_REQUEST_WORKERS)) as executor:
+            return list(executor.map(self.send_request, payloads))
+
+    def _mount_adapter(self, threads: int):
+        """Mounts a connection pool big enough for the waitress threads and send_requests_parallel."""
+        # One keep-alive connection per concurrent caller, so concurrent requests don't open new ones.
+        # pool_block makes an extra caller wait for a free connection instead of opening one that is thrown away
+        self._pool_size = max(threads, PARALLEL_REQUEST_WORKERS)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=self._pool_size, pool_block=True,
+                              max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def start_server(self, threads: Optional[int] = None):
         """
         Starts the Flask server and binds it to the specified host and port.
         Includes improvements like graceful shutdown and better exception handling.
+
+        :param threads: Waitress worker threads. Defaults to SERVER_THREADS.
         """
 
+        threads = threads or SERVER_THREADS
+        # More waitress threads than pooled connections would make the extra threads wait on pool_block
+        if threads > self._pool_size:
+            self._mount_adapter(threads)
+
         # Log the startup attempt
         logger.info(f"Attempting to start server on port {self.port}...")
 
@@ -142,8 +239,8 @@ class RemoteClient:
                 self.app,
                 host='0.0.0.0',  # Listen on all interfaces
                 port=self.port,
-                threads=multiprocessing.cpu_count() * 2,  # Use all available CPU threads
-                channel_timeout=300,
+                threads=threads,  # Can be overridden with the WAITRESS_THREADS environment variable
+                channel_timeout=60,  # Reclaim idle sockets sooner
                 cleanup_interval=30,  # Regular cleanup
                 connection_limit=1000  # Connection limit for security
             )
@@ -155,6 +252,36 @@ class RemoteClient:
             logger.error(f"Server failed to start: {e}")
             raise
 
+    def stop(self):
+        """Signals the background threads (health check) to finish."""
+        self._shutdown.set()
+
+    def close(self):
+        """Stops the background threads and closes the pooled connections to the target client."""
+        self.stop()
+        self.session.close()
+
+    def _start_system_info_sampler(self):
+        """Takes a system sample every CPU_USAGE_INTERVAL seconds (configuration.ini) until stop() is called"""
+        # A missing or zero interval would make the thread spin, so it never samples faster than twice a second
+        interval = max(float(config.configuration["cpu_usage_interval"] or 1), 0.5)
+
+        def sample():
+            while not self._shutdown.wait(interval):
+                self._system_info = self._read_system_info()
+
+        # The first non-blocking cpu_percent() call always returns 0.0, it only sets the starting point
+        self._system_info = self._read_system_info()
+        threading.Thread(target=sample, daemon=True).start()
+
+    @staticmethod
+    def _read_system_info() -> dict:
+        return {
+            'cpu_usage': psutil.cpu_percent(interval=None),  # Usage since the previous sample, without blocking
+            'memory': psutil.virtual_memory()._asdict(),
+            'disk': psutil.disk_usage('/')._asdict()
+        }
+
     # IMPROVEMENT: Added health check system
     def _start_health_check(self):
         # TODO Create a health endpoint to answer the heath check from the client
@@ -163,11 +290,15 @@ class RemoteClient:
         def health_check():
             while True:
                 try:
-                    response = self.session.post(f'{self.target_url}/api/health')
-                    self.last_health_check = response.json()
+                    response = self.session.post(f'{self.target_url}/api/health', timeout=HEALTH_CHECK_TIMEOUT)
+                    peer_status = response.json()
+                    self.last_health_check.update(timestamp=time.time(), ok=True, peer=peer_status)
                 except Exception as e:
+                    self.last_health_check.update(timestamp=time.time(), ok=False)
                     logger.warning(f"Health check failed: {e}")
-                threading.Event().wait(60)  # Check every minute
+                # Waiting on the shutdown event works as the timer, and stop() ends the loop without waiting the minute
+                if self._shutdown.wait(60):  # Check every minute
+                    break
 
         # threading.Thread(target=health_check, daemon=True).start()
 
@@ -182,36 +313,81 @@ class RemoteClient:
         - Clearer response messages.
         - Separation of concerns: JSON validation and command execution are separate functions.
         """
-        json_data = request.get_json()
+        # Bounds the parser work. A batch of commands is still far smaller than this
+        content_length = request.content_length  # Each access to the request proxy resolves the current request again
+        if content_length and content_length > MAX_COMMAND_BODY:
+            logger.error(f"CommandEndpoint: Request body too large ({content_length} bytes).")
+            return jsonify(_ERR_BODY_TOO_LARGE), 413
+
+        json_data = request.get_json(silent=True)  # Malformed JSON is answered as a missing command
 
+        # Several commands can be sent in one request as {"commands": [{"command": ..., "message": ...}, ...]}
+        if isinstance(json_data, dict) and isinstance(json_data.get('commands'), list):
+            return self._execute_command_batch(json_data['commands'])
+
+        return self._execute_command(json_data)
+
+    def _execute_command(self, json_data):
+        """Validates a single command request and executes it."""
         # Validate that JSON data exists and contains 'command'
-        if not json_data or 'command' not in json_data:
-            logging.log(config.LogLevel.ERROR.value, "CommandEndpoint: Missing 'command' in request.")
-            return jsonify(ErrorResponse("Command not provided", config.LogLevel.ERROR).to_dict()), 400
+        if not isinstance(json_data, dict) or 'command' not in json_data:
+            logger.error("CommandEndpoint: Missing 'command' in request.")
+            return jsonify(_ERR_NO_COMMAND), 400
 
         command_name = json_data['command']
 
         # Validate that command exists
-        if command_name not in self.commands:
-            logging.log(config.LogLevel.ERROR.value, f"CommandEndpoint: Command '{command_name}' does not exist.")
+        command = self.commands.get(command_name)
+        if command is None:
+            logger.error(f"CommandEndpoint: Command '{command_name}' does not exist.")
             return jsonify(
                 ErrorResponse(f"Command '{command_name}' does not exist", config.LogLevel.ERROR).to_dict()), 404
 
-        command = self.commands.get(command_name)
-
-        message = json_data.get('message')
-        if command.needs_message() and not message:
-            logging.log(config.LogLevel.ERROR.value, f"CommandEndpoint: Command '{command_name}' needs a message.")
-            return jsonify(
-                ErrorResponse(f"Command '{command_name}' needs a message.", config.LogLevel.ERROR).to_dict()), 400
+        message = None  # Command.execute ignores the message of the commands that don't need one
+        if command.needs_message:
+            message = json_data.get('message')
+            if not message:
+                logger.error(f"CommandEndpoint: Command '{command_name}' needs a message.")
+                return jsonify(
+                    ErrorResponse(f"Command '{command_name}' needs a message.", config.LogLevel.ERROR).to_dict()), 400
 
         try:
             return command.execute(message)
         except Exception as e:
-            logging.log(config.LogLevel.ERROR.value,
-                        f"CommandEndpoint: Execution failed for command '{command_name}': {e}")
+            logger.error(f"CommandEndpoint: Execution failed for command '{command_name}': {e}")
             return jsonify(ErrorResponse(f"Command execution failed: {str(e)}", config.LogLevel.ERROR).to_dict()), 500
 
+    def _execute_command_batch(self, batch: list):
+        """
+        Executes a batch of commands and returns all the results in a single response.
+        Each result contains the status code and the response body the command would have had on its own.
+        The commands run one after another, in order, unless every command of the batch allows concurrent execution.
+        """
+        if not batch:
+            logger.error("CommandEndpoint: Empty 'commands' list in request.")
+            return jsonify(_ERR_EMPTY_BATCH), 400
+
+        def execute(json_data):
+            # The worker threads don't have the request's app context, which jsonify needs
+            with self.app.app_context():
+                response, status_code = self._execute_command(json_data)
+                return {"status_code": status_code, "response": response.get_json()}
+
+        if all(self._allows_concurrency(json_data) for json_data in batch):
+            with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(batch))) as executor:
+                results = list(executor.map(execute, batch))
+        else:
+            results = [execute(json_data) for json_data in batch]
+
+        return jsonify(
+            APIResponse.SuccessResponse(f"{len(results)} commands executed", {"results": results}).to_dict()
+        ), 200
+
+    def _allows_concurrency(self, json_data) -> bool:
+        """Whether the command of a batch entry exists and can run at the same time as others"""
+        command = self.commands.get(json_data.get('command')) if isinstance(json_data, dict) else None
+        return command is not None and command.concurrent
+
     # IMPROVEMENT: Added health check endpoint
     def health_check_endpoint(self):
         """Endpoint for system health monitoring"""
@@ -234,11 +410,23 @@ class RemoteClient:
     # @app.route('/api/processes', methods=['GET'])
     def list_processes(self):
         """ Get a list of all running processes """
-        processes: list[psutil.Process] = []
-        for proc in psutil.process_iter(['pid', 'name', 'status']):
-            processes.append(proc.info)
-        return jsonify(APIResponse.ProcessResponse(message="List of current processes on {self.name}",
-                                                   processes=processes).to_dict()), 200
+        return Response(self._get_processes_body(), mimetype='application/json'), 200
+
+    def _get_processes_body(self) -> str:
+        """
+        Serialized process list response, reused for PROCESS_LIST_TTL seconds so rapid polls don't walk the process
+        table nor serialize it again
+        """
+        now = time.monotonic()
+        cached_at, body = self._processes_cache
+        if body is None or now - cached_at >= PROCESS_LIST_TTL:
+            # process_iter already skips the processes that die while iterating, and ad_value fills the attributes
+            # that raise AccessDenied, so no per-process exception handling is needed
+            processes = [proc.info for proc in psutil.process_iter(attrs=('pid', 'name', 'status'), ad_value=None)]
+            body = self.app.json.dumps(APIResponse.ProcessResponse(message=f"List of current processes on {self.name}",
+                                                                   processes=processes).to_dict())
+            self._processes_cache = (now, body)
+        return body
 
     # @app.route('/api/processes/<int:process_id>', methods=['GET'])
     def get_process_status(self, process_id):
@@ -249,7 +437,7 @@ class RemoteClient:
             return jsonify(
                 APIResponse.SystemInfoResponse(process.as_dict(attrs=['pid', 'name', 'status'])).to_dict()), 200
         except psutil.NoSuchProcess:
-            return jsonify(APIResponse.ErrorResponse('error', 'Process not found').to_dict()), 404
+            return jsonify(_ERR_NO_PROCESS), 404
 
     # @app.route('/api/processes/kill', methods=['POST'])
     def kill_process(self):
@@ -258,41 +446,47 @@ class RemoteClient:
         process_id = data.get('process_id')
 
         if process_id is None:
-            return jsonify(APIResponse('error', 'Missing process_id').to_dict()), 400
+            return jsonify(_ERR_MISSING_PID), 400
 
         try:
             process = psutil.Process(process_id)
             process.terminate()
-            return jsonify(APIResponse('success', 'Process {process_id} terminated').to_dict()), 200
+            return jsonify(APIResponse.APIResponse('success', f'Process {process_id} terminated').to_dict()), 200
         except psutil.NoSuchProcess:
-            return jsonify(APIResponse('error', 'Process not found').to_dict()), 404
+            return jsonify(_ERR_NO_PROCESS), 404
         except Exception as e:
-            return jsonify(APIResponse('error', str(e)).to_dict()), 500
+            return jsonify(APIResponse.APIResponse('error', str(e)).to_dict()), 500
 
     # @app.route('/api/programs/sync', methods=['POST'])
     def sync_programs(self):
         """ Sync programs from JSON configuration """
         if not os.path.exists(CONFIG_PATH):
-            return jsonify(APIResponse('error', 'Configuration file not found').to_dict()), 500
+            return jsonify(_ERR_CONFIG_MISSING), 500
 
-        with open(CONFIG_PATH, 'r') as f:
-            try:
-                programs = json.load(f)
-            except json.JSONDecodeError:
-                return jsonify(APIResponse('error', 'Invalid JSON format').to_dict()), 500
+        try:
+            programs = self._load_programs()
+        except json.JSONDecodeError:
+            return jsonify(APIResponse.APIResponse('error', 'Invalid JSON format').to_dict()), 500
 
-        return jsonify(APIResponse('success', programs).to_dict()), 200
+        return jsonify(APIResponse.APIResponse('success', 'Programs synchronized', programs).to_dict()), 200
 
     # @app.route('/api/programs', methods=['GET'])
     def get_programs(self):
         """ Get a list of all programs from JSON """
         if not os.path.exists(CONFIG_PATH):
-            return jsonify(APIResponse('error', 'Configuration file not found').to_dict()), 500
+            return jsonify(_ERR_CONFIG_MISSING), 500
+
+        programs = self._load_programs()
 
-        with open(CONFIG_PATH, 'r') as f:
-            programs = json.load(f)
+        return jsonify(APIResponse.APIResponse('success', 'List of programs', programs).to_dict()), 200
 
-        return jsonify(APIResponse('success', programs).to_dict()), 200
+    def _load_programs(self):
+        """ Parsed programs JSON. The file is only read again when its modification time changes """
+        mtime = os.stat(CONFIG_PATH).st_mtime_ns
+        if self._programs_cache[0] != mtime:
+            with open(CONFIG_PATH, 'rb') as f:
+                self._programs_cache = (mtime, self.app.json.loads(f.read()))
+        return self._programs_cache[1]
 
     # ========================
     #  SYSTEM INFORMATION
@@ -301,42 +495,42 @@ class RemoteClient:
     # @app.route('/api/system/info', methods=['GET'])
     def get_system_info(self):
         """ Get system information (CPU, RAM, Disk) """
-        system_info = {
-            'cpu_usage': psutil.cpu_percent(interval=1),
-            'memory': psutil.virtual_memory()._asdict(),
-            'disk': psutil.disk_usage('/')._asdict()
-        }
-        return jsonify(APIResponse('success', system_info).to_dict()), 200
+        return jsonify(APIResponse.APIResponse('success', 'System information', self._system_info).to_dict()), 200
 
     # @app.route('/api/system/logs', methods=['GET'])
     def get_system_logs(self):
         """ Get the latest system logs (Windows Event Logs) """
-        logs = []
-        try:
-            import win32evtlog  # Requires `pywin32`
-            server = None  # Local machine
-            log_type = 'System'
-
-            hand = win32evtlog.OpenEventLog(server, log_type)
-            flags = win32evtlog.EVENTLOG_BACKWARDS_READ | win32evtlog.EVENTLOG_SEQUENTIAL_READ
-            total = win32evtlog.GetNumberOfEventLogRecords(hand)
-
-            events = win32evtlog.ReadEventLog(hand, flags, 0)
-            for event in events[:10]:  # Get last 10 logs
-                logs.append({
-                    'event_id': event.EventID,
-                    'time_generated': event.TimeGenerated.Format(),
-                    'source': event.SourceName,
-                    'category': event.EventCategory
-                })
-
-            win32evtlog.CloseEventLog(hand)
-        except ImportError:
-            return jsonify(APIResponse('error', 'win32evtlog not available').to_dict()), 500
-        except Exception as e:
-            return jsonify(APIResponse('error', str(e)).to_dict()), 500
+        now = time.monotonic()
+        cached_at, logs = self._system_logs_cache
+        if logs is None or now - cached_at >= SYSTEM_LOGS_TTL:
+            if not self._WIN32EVTLOG_AVAILABLE:
+                return jsonify(APIResponse.APIResponse('error', 'win32evtlog not available').to_dict()), 500
+            try:
+                logs = self._read_system_events(10)  # Get last 10 logs
+            except Exception as e:
+                return jsonify(APIResponse.APIResponse('error', str(e)).to_dict()), 500
+            self._system_logs_cache = (now, logs)
 
-        return jsonify(APIResponse('success', logs).to_dict()), 200
+        return jsonify(APIResponse.APIResponse('success', 'System logs', logs).to_dict()), 200
+
+    def _read_system_events(self, count: int) -> list:
+        """ Reads the newest events of the System log. Only 'count' events are requested from the event log service """
+        import win32evtlog  # Requires `pywin32`
+        import xml.etree.ElementTree as ElementTree
+
+        query = win32evtlog.EvtQuery('System',
+                                     win32evtlog.EvtQueryChannelPath | win32evtlog.EvtQueryReverseDirection)
+        logs = []
+        for event in win32evtlog.EvtNext(query, count):
+            event_xml = ElementTree.fromstring(win32evtlog.EvtRender(event, win32evtlog.EvtRenderEventXml))
+            system = event_xml.find('e:System', EVENT_XML_NAMESPACE)
+            logs.append({
+                'event_id': int(system.findtext('e:EventID', namespaces=EVENT_XML_NAMESPACE)),
+                'time_generated': system.find('e:TimeCreated', EVENT_XML_NAMESPACE).get('SystemTime'),
+                'source': system.find('e:Provider', EVENT_XML_NAMESPACE).get('Name'),
+                'category': int(system.findtext('e:Task', default='0', namespaces=EVENT_XML_NAMESPACE))
+            })
+        return logs
 
     # ========================
     #  AUTHENTICATION
@@ -350,11 +544,16 @@ class RemoteClient:
         password = data.get('password')
 
         if username == 'admin' and password == 'password':  # Replace with real authentication
-            token = os.urandom(16).hex()
-            VALID_TOKENS[token] = username
-            return jsonify(APIResponse('success', token).to_dict()), 200
+            token = secrets.token_urlsafe(32)
+            now = time.monotonic()
+            with VALID_TOKENS_LOCK:
+                # Drop the expired tokens so the dict doesn't grow forever
+                for expired in [t for t, (_, expires) in VALID_TOKENS.items() if expires <= now]:
+                    del VALID_TOKENS[expired]
+                VALID_TOKENS[token] = (username, now + TOKEN_LIFETIME)
+            return jsonify(APIResponse.APIResponse('success', 'Logged in', token).to_dict()), 200
 
-        return jsonify(APIResponse('error', 'Invalid credentials').to_dict()), 401
+        return jsonify(_ERR_INVALID_CREDENTIALS), 401
 
     # @app.route('/api/auth/logout', methods=['POST'])
     def logout(self):
@@ -362,10 +561,11 @@ class RemoteClient:
         data = request.json
         token = data.get('token')
 
-        if token in VALID_TOKENS:
-            del VALID_TOKENS[token]
-            return jsonify(APIResponse('success', 'Logged out').to_dict()), 200
+        with VALID_TOKENS_LOCK:
+            entry = VALID_TOKENS.pop(token, None)
+        if entry is not None and entry[1] > time.monotonic():
+            return jsonify(APIResponse.APIResponse('success', 'Logged out').to_dict()), 200
 
-        return jsonify(APIResponse('error', 'Invalid token').to_dict()), 401
+        return jsonify(_ERR_INVALID_TOKEN), 401
 
 # --------------------------------------------- ENDPOINT FUNCTIONS END ------------------------------------------------
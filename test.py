@@ -1,5 +1,7 @@
 import pytest
+import copy
 import json
+import time
 from unittest.mock import Mock, patch, MagicMock
 from flask import Flask, jsonify
 import requests
@@ -11,16 +13,23 @@ from remote_client import RemoteClient
 
 
 @pytest.fixture
-def client():
-    """Fixture to create a test client"""
+def remote_client():
+    """Fixture to create a RemoteClient"""
     remote_client = RemoteClient(
         name="Test Client",
         port=5001,
         target_url="http://localhost:5000"
     )
+    yield remote_client
+    # Detiene los hilos en segundo plano y cierra la sesión
+    remote_client.close()
+
+
+@pytest.fixture
+def client(remote_client):
+    """Fixture to create a test client"""
     # Create a test client using Flask's test_client
-    test_client = remote_client.app.test_client()
-    return test_client
+    return remote_client.app.test_client()
 
 
 class TestRemoteClientEndpoints:
@@ -97,6 +106,31 @@ class TestRemoteClientEndpoints:
         assert data['status'] == 'success'
         assert test_message in data['message']
 
+    def test_command_endpoint_batch(self, client):
+        """Test command endpoint with a batch of commands"""
+        response = client.post('/api/command', json={'commands': [
+            {'command': 'test_command'},
+            {'command': 'invalid_command'}
+        ]})
+        data = json.loads(response.data)
+
+        # Un resultado por comando, en el mismo orden y con su propio código
+        assert response.status_code == 200
+        assert data['status'] == 'success'
+        results = data['data']['results']
+        assert [result['status_code'] for result in results] == [200, 404]
+        assert 'executed correctly' in results[0]['response']['message']
+        assert 'does not exist' in results[1]['response']['message']
+
+    def test_command_endpoint_body_too_large(self, client):
+        """Test command endpoint rejects oversized bodies"""
+        response = client.post('/api/command', json={'command': 'test_command', 'message': 'x' * 70000})
+        data = json.loads(response.data)
+
+        # El cuerpo se rechaza antes de parsear el JSON
+        assert response.status_code == 413
+        assert data['status'] == 'error'
+
     def test_options_preflight(self, client):
         """Test CORS preflight request"""
         response = client.options('/api/test')
@@ -127,6 +161,94 @@ class TestRemoteClientEndpoints:
         assert info != "Unknown"
 
 
+class TestConfigurationParsing:
+    """Tests for the configuration.ini parsing"""
+
+    @pytest.mark.parametrize('value, expected', [
+        ('true', True), ('False', False),
+        ('5000', 5000), ('-3', -3), ('+7', 7), ('1_000', 1000),
+        ('1.5', 1.5), ('.5', 0.5), ('1e5', 100000.0),
+        ('system.log', 'system.log'), ('nan', 'nan'), ('inf', 'inf'), ('1.2.3', '1.2.3'), ('', ''),
+    ])
+    def test_parse_value(self, value, expected):
+        result = config.configuration.parse_value(value)
+        # Mismo valor y mismo tipo (True no es 1, 1.0 no es 1)
+        assert result == expected
+        assert type(result) is type(expected)
+
+    def test_load_config(self, tmp_path):
+        config_file = tmp_path / 'configuration.ini'
+        config_file.write_text(
+            "# Server settings\n"
+            "  PORT = 5000  \n"
+            "DEBUG=True\n"
+            "\n"
+            "line without equals sign\n"
+            "#COMMENTED = 1\n"
+            "PATH_PROGRAMS = config/programs.json\n"
+            "EMPTY =\n"
+        )
+        # Copia de la configuración compartida para no modificarla
+        configuration = copy.copy(config.configuration)
+        configuration.config_path = str(config_file)
+        configuration.load_config()
+
+        # Las líneas sin '=' y los comentarios se ignoran, las claves no distinguen mayúsculas
+        assert configuration._settings == {
+            'port': 5000,
+            'debug': True,
+            'path_programs': 'config/programs.json',
+            'empty': '',
+        }
+        assert configuration['port'] == 5000
+
+
+class TestAuthentication:
+    """Tests for login/logout and the token lifetime"""
+
+    @staticmethod
+    def _call(remote_client, handler, body):
+        # Las rutas de autenticación no están registradas, se llaman dentro de un contexto de petición
+        with remote_client.app.test_request_context(json=body):
+            response, status_code = handler()
+            return status_code, response.get_json()
+
+    def _login(self, remote_client):
+        return self._call(remote_client, remote_client.login, {'username': 'admin', 'password': 'password'})
+
+    def test_login_and_logout(self, remote_client):
+        status_code, data = self._login(remote_client)
+        # El login devuelve un token válido
+        assert status_code == 200
+        token = data['data']
+        assert token in config.VALID_TOKENS
+
+        status_code, data = self._call(remote_client, remote_client.logout, {'token': token})
+        # El logout invalida el token, que no se puede usar dos veces
+        assert status_code == 200
+        assert token not in config.VALID_TOKENS
+        assert self._call(remote_client, remote_client.logout, {'token': token})[0] == 401
+
+    def test_login_invalid_credentials(self, remote_client):
+        status_code, data = self._call(remote_client, remote_client.login, {'username': 'admin', 'password': 'x'})
+        assert status_code == 401
+        assert data['status'] == 'error'
+
+    def test_logout_expired_token(self, remote_client):
+        token = self._login(remote_client)[1]['data']
+        # Un token caducado se rechaza
+        expired = time.monotonic() + config.TOKEN_LIFETIME + 1
+        with patch('time.monotonic', return_value=expired):
+            status_code, data = self._call(remote_client, remote_client.logout, {'token': token})
+        assert status_code == 401
+        assert token not in config.VALID_TOKENS
+
+    def test_token_lifetime_default(self):
+        # Sin TOKEN_EXPIRATION_MINUTES el token dura 60 minutos
+        assert config.token_lifetime(None) == 60 * 60
+        assert config.token_lifetime(5) == 5 * 60
+
+
 def test_cors_headers(client):
     """Test CORS headers are properly set."""
     response = client.options(
@@ -142,6 +264,21 @@ def test_cors_headers(client):
     assert 'POST' in headers['Access-Control-Allow-Methods']
 
 
+@pytest.mark.parametrize('origin, allowed', [
+    ('http://localhost:3000', True),
+    ('http://127.0.0.1', True),
+    ('http://localhost.evil.com', False),
+])
+def test_cors_allowed_origins(client, origin, allowed):
+    """Test that only local development origins get CORS headers."""
+    response = client.get('/api/test', headers={'Origin': origin})
+
+    # Un dominio que empieza por "localhost" no es un origen local
+    assert ('Access-Control-Allow-Origin' in response.headers) == allowed
+    if allowed:
+        assert response.headers['Access-Control-Allow-Origin'] == origin
+
+
 @pytest.mark.performance
 class TestRemoteClientPerformance:
     """Performance tests for RemoteClient"""
@@ -12,8 +12,8 @@ endpoints = []
 post_endpoints = {"show_message_window"}  # Lista de endpoints GET conocidos
 
 if os.path.isdir(ENDPOINTS_FOLDER):
-    excluded_simple_endpoints = ["blueprint_endpoint", "__init__"]
-    excluded_complex_enpoints = ["__pycache__"]
+    excluded_simple_endpoints = frozenset({"blueprint_endpoint", "__init__"})
+    excluded_complex_enpoints = frozenset({"__pycache__"})
     print(os.listdir(ENDPOINTS_FOLDER))
     endpoints = [
         f[:-3] for f in os.listdir(ENDPOINTS_FOLDER)
@@ -22,39 +22,47 @@ if os.path.isdir(ENDPOINTS_FOLDER):
         f for f in os.listdir(ENDPOINTS_FOLDER)
         if os.path.isdir(os.path.join(ENDPOINTS_FOLDER, f)) and os.path.exists(os.path.join(ENDPOINTS_FOLDER, f, "endpoint.py")) and f not in excluded_complex_enpoints
     ]
+# Sesión compartida: las conexiones al servidor se reutilizan entre clics
+session = requests.Session()
+
 # Función para enviar la solicitud en un hilo separado
 def send_request():
-    threading.Thread(target=send_request_thread, daemon=True).start()
-
-# Función que ejecuta la solicitud sin bloquear la interfaz
-def send_request_thread():
+    # Tk no es thread-safe, los campos se leen aquí en el hilo principal
     selected_endpoint = endpoint_var.get()
     message = message_entry.get()
     port = port_entry.get()
-    
-    # Limpiar respuesta anterior
-    response_text.delete(1.0, tk.END)
-    
+
     if not port:
-        response_text.insert(tk.END, "Error: El campo 'port' es obligatorio.")
+        show_response("Error: El campo 'port' es obligatorio.")
         return
     if not selected_endpoint:
-        response_text.insert(tk.END, "Error: Debes seleccionar un endpoint.")
+        show_response("Error: Debes seleccionar un endpoint.")
         return
-    
+
+    threading.Thread(target=send_request_thread, args=(selected_endpoint, message, port), daemon=True).start()
+
+# Función que ejecuta la solicitud sin bloquear la interfaz
+def send_request_thread(selected_endpoint, message, port):
     url = f"http://localhost:{port}/api/{selected_endpoint}"
     try:
         if selected_endpoint in post_endpoints:
             payload = {"message": message}
-            response = requests.post(url, json=payload)
+            response = session.post(url, json=payload, timeout=10)
         else:
-            response = requests.get(url)
-        
+            response = session.get(url, timeout=10)
+
         response_data = response.json()
-        formatted_response = json.dumps(response_data, indent=4)
-        response_text.insert(tk.END, formatted_response)
-    except requests.exceptions.RequestException as e:
-        response_text.insert(tk.END, f"Error en la solicitud: {e}")
+        result = json.dumps(response_data, indent=4)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        result = f"Error en la solicitud: {e}"
+    # El resultado se pasa al hilo principal, que es el único que puede tocar los widgets
+    root.after(0, show_response, result)
+
+# Sustituye el contenido del cuadro de respuesta en un solo paso, el widget se redibuja una vez
+def show_response(text):
+    response_text.configure(state=tk.NORMAL)
+    response_text.replace("1.0", tk.END, text)
+    response_text.configure(state=tk.DISABLED)  # Solo lectura hasta la siguiente respuesta
 
 # Configuración de la ventana
 root = tk.Tk()
@@ -95,7 +103,7 @@ send_button.pack(pady=10)
 # Respuesta del servidor
 response_label = tk.Label(main_frame, text="Server Response:")
 response_label.pack()
-response_text = scrolledtext.ScrolledText(main_frame, height=10)
+response_text = scrolledtext.ScrolledText(main_frame, height=10, state=tk.DISABLED)
 response_text.pack(fill=tk.BOTH, expand=True)
 
 root.mainloop()
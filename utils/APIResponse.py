@@ -3,10 +3,16 @@ from functools import wraps
 from typing import Optional, Dict
 
 import psutil
-from flask import jsonify
+from flask import jsonify, request
+from werkzeug.exceptions import HTTPException
 
 from config import LogLevel, logger
 
+# Numeric levels read once. The messages use %-style arguments, so they're only formatted when the level is enabled
+_INFO = LogLevel.INFO.value
+_WARNING = LogLevel.WARNING.value
+_ERROR = LogLevel.ERROR.value
+
 
 class APIResponse:
     """Base API Response class for standardizing API responses."""
@@ -32,7 +38,7 @@ class SuccessResponse(APIResponse):
 
     def __init__(self, message: str, data: Optional[Dict] = None):
         # Log successful response with message and data details
-        logging.log(LogLevel.INFO.value, f"SuccessResponse: {message}, Data: {data}")
+        logging.log(_INFO, "SuccessResponse: %s, Data: %s", message, data)
         super().__init__("success", message, data)
 
 
@@ -41,7 +47,7 @@ class ProcessResponse(SuccessResponse):
 
     def __init__(self, processes: list[psutil.Process], message: Optional[str]):
         # Log process-related response with number of processes
-        logging.log(LogLevel.INFO.value, f"ProcessResponse: {len(processes)} processes retrieved.")
+        logging.log(_INFO, "ProcessResponse: %d processes retrieved.", len(processes))
         super().__init__(message if message else "Process operation successful", {"processes": processes})
 
 
@@ -50,7 +56,7 @@ class ProgramResponse(SuccessResponse):
 
     def __init__(self, programs: Dict):
         # Log program retrieval success with program count
-        logging.log(LogLevel.INFO.value, f"ProgramResponse: {len(programs)} programs retrieved.")
+        logging.log(_INFO, "ProgramResponse: %d programs retrieved.", len(programs))
         super().__init__("Program operation successful", {"programs": programs})
 
 
@@ -59,7 +65,7 @@ class SystemInfoResponse(SuccessResponse):
 
     def __init__(self, system_data: Dict, message: Optional[str] = None):
         # Log system info retrieval success
-        logging.log(LogLevel.INFO.value, f"SystemInfoResponse: {message or 'System info retrieved'}")
+        logging.log(_INFO, "SystemInfoResponse: %s", message or 'System info retrieved')
         super().__init__("System information", system_data)
 
 
@@ -68,7 +74,7 @@ class LogResponse(SuccessResponse):
 
     def __init__(self, logs: Dict):
         # Log number of logs retrieved
-        logging.log(LogLevel.INFO.value, f"LogResponse: {len(logs)} log entries retrieved.")
+        logging.log(_INFO, "LogResponse: %d log entries retrieved.", len(logs))
         super().__init__("System logs retrieved", {"logs": logs})
 
 
@@ -81,7 +87,7 @@ class ErrorResponse(APIResponse):
 
     def __init__(self, message: str, log_level: LogLevel):
         # Log error response with severity level
-        logging.log(log_level.value, f"ErrorResponse: {message}")
+        logging.log(log_level.value, "ErrorResponse: %s", message)
         super().__init__("error", message)
 
 
@@ -90,7 +96,7 @@ class NotFoundResponse(ErrorResponse):
 
     def __init__(self, resource: str):
         # Log missing resource
-        logging.log(LogLevel.WARNING.value, f"NotFoundResponse: {resource} not found.")
+        logging.log(_WARNING, "NotFoundResponse: %s not found.", resource)
         super().__init__(f"{resource} not found", LogLevel.WARNING)
 
 
@@ -99,7 +105,7 @@ class ValidationErrorResponse(ErrorResponse):
 
     def __init__(self, field: str):
         # Log missing or invalid field
-        logging.log(LogLevel.WARNING.value, f"ValidationErrorResponse: Missing or invalid field: {field}")
+        logging.log(_WARNING, "ValidationErrorResponse: Missing or invalid field: %s", field)
         super().__init__(f"Missing or invalid field: {field}", LogLevel.WARNING)
 
 
@@ -108,7 +114,7 @@ class InternalErrorResponse(ErrorResponse):
 
     def __init__(self, error: str):
         # Log internal server error
-        logging.log(LogLevel.ERROR.value, f"InternalErrorResponse: {error}")
+        logging.log(_ERROR, "InternalErrorResponse: %s", error)
         super().__init__(f"Internal server error: {error}", LogLevel.ERROR)
 
 
@@ -124,9 +130,25 @@ def error_handler(f):
         try:
             return f(*args, **kwargs)
         except Exception as e:
-            logger.error(LogLevel.ERROR.value, f"Error in {f.__name__}: {str(e)}", exc_info=True)
+            logger.error(f"Error in {f.__name__}: {str(e)}", exc_info=True)
             return jsonify(
                 ErrorResponse(f"Internal server error: {str(e)}", log_level=LogLevel.ERROR).to_dict()
             ), 500
 
     return wrapper
+
+
+def register_error_handler(app):
+    """
+    Installs one app-wide handler that turns any unhandled exception into the standard error response, so the views
+    don't need to be wrapped with error_handler. HTTP errors (404, 405...) keep Flask's own answer.
+    """
+
+    @app.errorhandler(Exception)
+    def handle_exception(e):
+        if isinstance(e, HTTPException):
+            return e
+        logger.error(f"Error in {request.endpoint}: {str(e)}", exc_info=True)
+        return jsonify(
+            ErrorResponse(f"Internal server error: {str(e)}", log_level=LogLevel.ERROR).to_dict()
+        ), 500
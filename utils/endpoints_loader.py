@@ -1,7 +1,62 @@
 import os
 import importlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 from config import logger
 
+# Resolved once, without the '..' segment, so every scan starts from the canonical path
+ENDPOINT_FOLDER = os.path.realpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'endpoints'))
+EXCLUDED_FILES = frozenset({'__init__.py', 'blueprint_endpoint.py'})
+EXCLUDED_DIRS = frozenset({'__pycache__'})  # Folders that are never endpoints, skipped without probing them
+IMPORT_MAX_WORKERS = 8  # Maximum number of endpoint modules imported at the same time
+
+
+def _folder_signature(endpoint_folder):
+    """
+    Modification times of the endpoints folder and its subfolders. Adding or removing an endpoint changes one of them.
+    """
+    signature = [os.stat(endpoint_folder).st_mtime_ns]
+    with os.scandir(endpoint_folder) as entries:
+        signature.extend(entry.stat().st_mtime_ns for entry in entries
+                         if entry.name not in EXCLUDED_DIRS and entry.is_dir())
+    return tuple(signature)
+
+
+@lru_cache(maxsize=1)
+def _discover_endpoints(endpoint_folder, signature):
+    """
+    Walks the endpoints folder and returns the (module_name, module_path) of every endpoint found.
+    The result is cached by the folder signature, so the folder is only walked again when it changes.
+    """
+    endpoints = []
+    # scandir returns each entry with its type, so telling files from folders doesn't need a stat call per item
+    with os.scandir(endpoint_folder) as entries:
+        for entry in entries:
+            item = entry.name
+
+            if entry.is_file() and item.endswith('.py') and item not in EXCLUDED_FILES:
+                # Simple endpoint (.py file in the root folder)
+                endpoints.append((item[:-3], f'endpoints.{item[:-3]}'))
+
+            elif item not in EXCLUDED_DIRS and entry.is_dir():
+                # Complex endpoint (folder containing an 'endpoint.py' file). The endpoint name is the folder name
+                if not os.path.exists(os.path.join(entry.path, 'endpoint.py')):
+                    logger.warn(f"Skipping '{item}': 'endpoint.py' not found in folder.")
+                    continue  # Required file not found, skipping
+                endpoints.append((item, f'endpoints.{item}.endpoint'))
+
+            # Anything else is neither a valid .py file nor a folder
+    return tuple(endpoints)
+
+
+def _import_module(module_path):
+    """Imports a module and returns (module, None), or (None, exception) if the import failed."""
+    try:
+        return importlib.import_module(module_path), None
+    except Exception as e:
+        return None, e
+
 
 def load_endpoints(app):
     """
@@ -22,47 +77,32 @@ def load_endpoints(app):
     """
 
     loaded_modules = {}  # Stores successfully loaded modules
-    endpoint_folder = os.path.join(os.path.dirname(__file__), '..', 'endpoints')
-
-    for item in os.listdir(endpoint_folder):
-        excluded_files = ['__init__.py', 'blueprint_endpoint.py']
-        full_path = os.path.join(endpoint_folder, item)
-
-        if os.path.isfile(full_path) and item.endswith('.py') and item not in excluded_files:
-            # Simple endpoint (.py file in the root folder)
-            module_name = item[:-3]
-            module_path = f'endpoints.{module_name}'
 
-        elif os.path.isdir(full_path):
-            # Complex endpoint (folder containing an 'endpoint.py' file)
-            module_name = item  # The endpoint name is the folder name
-            endpoint_file = os.path.join(full_path, 'endpoint.py')
+    endpoints = _discover_endpoints(ENDPOINT_FOLDER, _folder_signature(ENDPOINT_FOLDER))
 
-            if not os.path.exists(endpoint_file):
-                logger.warn(f"Skipping '{module_name}': 'endpoint.py' not found in folder.")
-                continue  # Required file not found, skipping
+    # The modules are imported concurrently so their disk reads overlap. register() is called afterwards, one at a time
+    with ThreadPoolExecutor(max_workers=max(1, min(IMPORT_MAX_WORKERS, len(endpoints)))) as executor:
+        imports = list(executor.map(_import_module, (module_path for _, module_path in endpoints)))
 
-            module_path = f'endpoints.{module_name}.endpoint'
-
-        else:
-            continue  # Neither a valid .py file nor a folder
-
-        # Attempt to import and register the module
+    for (module_name, _), (module, error) in zip(endpoints, imports):
+        # Attempt to register the module
         loaded_modules[module_name] = False
-        try:
-            module = importlib.import_module(module_path)
+        if error is not None:
+            logger.warn(f"Failed to load module '{module_name}' - {error}")
+            continue
 
-            if hasattr(module, 'register'):
-                try:
-                    if module.register(app, module_name) == 0:
-                        loaded_modules[module_name] = True
-                    else:
-                        raise ImportError(f"Failed to register endpoint '{module_name}'.")
-                except Exception as e:
-                    logger.warn(f"Failed on 'register()' function for '{module_name}'. - {e}")
+        try:
+            register = module.register
+        except AttributeError:
+            continue  # Modules without register() are skipped, as before
 
+        try:
+            if register(app, module_name) == 0:
+                loaded_modules[module_name] = True
+            else:
+                raise ImportError(f"Failed to register endpoint '{module_name}'.")
         except Exception as e:
-            logger.warn(f"Failed to load module '{module_name}' - {e}")
+            logger.warn(f"Failed on 'register()' function for '{module_name}'. - {e}")
 
         if loaded_modules[module_name]:
-            logger.debug(f"Loaded module '{module_name}' - OK")
\ No newline at end of file
+            logger.debug(f"Loaded module '{module_name}' - OK")
@@ -0,0 +1,28 @@
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, without it Flask's default provider is kept
+    orjson = None
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that uses orjson, which serializes several times faster than the json module."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        # Types orjson can't serialize are handled the same way as the default provider does
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def set_json_provider(app):
+    """Makes jsonify and request.get_json use orjson if it's installed."""
+    if orjson is not None:
+        app.json = ORJSONProvider(app)